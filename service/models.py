@@ -60,6 +60,10 @@ class Category(Enum):
     TOOLS = 5
 
 
+# Names of the valid categories for fast validation when deserializing
+Category._names = frozenset(category.name for category in Category)  # pylint: disable=protected-access
+
+
 class Product(db.Model):
     """
     Class that represents a Product
@@ -140,7 +144,9 @@ class Product(db.Model):
                     "Invalid type for boolean [available]: "
                     + str(type(data["available"]))
                 )
-            self.category = getattr(Category, data["category"])  # create enum from string
+            if data["category"] not in Category._names:  # pylint: disable=protected-access
+                raise DataValidationError("Invalid attribute: " + str(data["category"]))
+            self.category = Category[data["category"]]  # create enum from string
         except AttributeError as error:
             raise DataValidationError("Invalid attribute: " + error.args[0]) from error
         except KeyError as error: